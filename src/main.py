@@ -69,6 +69,7 @@ def main():
     parser.add_argument("--config", required=True, help="Path to config JSON file")
     parser.add_argument("--spacers", type=int, default=0, help="Number of spacer segments to add")
     parser.add_argument("--coords", action="store_true", help="Emboss lat/long on base")
+    parser.add_argument("--sign-cache", help="Directory for reusing unchanged sign STLs between runs")
     parser.add_argument("--debug", action="store_true", help="Enable verbose debug output")
     args = parser.parse_args()
     HOME, LOCATIONS, units, user_agent = load_config(args.config)
@@ -109,7 +110,7 @@ def main():
     os.makedirs(output_dir, exist_ok=True)
     
     # Initialize the STL generator
-    generator = DirectionSignGenerator(debug=args.debug)
+    generator = DirectionSignGenerator(sign_cache_dir=args.sign_cache, debug=args.debug)
     
     config_basename = os.path.splitext(os.path.basename(args.config))[0]
 
@@ -136,13 +137,16 @@ def main():
         output_dir,
         f"{config_basename}_sign_1_{HOME.name.replace(' ', '_').replace(',', '')}.stl"
     )
-    generator.generate_sign(HOME.name, "", home_sign_path, 90.0, segment_id=1, arrowed=False)
+    sign_jobs = [dict(text=HOME.name, distance="", output_path=home_sign_path,
+                      bearing=90.0, segment_id=1, arrowed=False)]
     for i, loc in enumerate(LOCATIONS):
         sign_filename = f"{config_basename}_sign_{i+2}_{loc.name.replace(' ', '_').replace(',', '')}.stl"
         sign_path = os.path.join(output_dir, sign_filename)
         distance_str = format_distance(loc.distance_km, units=units)
         # Pass bearing to determine sign direction
-        generator.generate_sign(loc.name, distance_str, sign_path, loc.bearing, segment_id=i + 2)
+        sign_jobs.append(dict(text=loc.name, distance=distance_str, output_path=sign_path,
+                              bearing=loc.bearing, segment_id=i + 2))
+    generator.generate_signs(sign_jobs)
     
     print("\n" + "=" * 70)
     print("\nGeneration complete!")
@@ -4,17 +4,29 @@ STL generation module for creating 3D models of the direction sign.
 
 from typing import List, Tuple
 import numpy as np
-from stl import mesh
+import hashlib
+import importlib.util
 import math
 import os
+import shutil
+import traceback
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import trimesh
 
+# Prefer the in-process manifold3d boolean engine; Blender is the only fallback.
+# trimesh drives whichever engine is chosen, so only its availability is probed here.
+if importlib.util.find_spec("manifold3d") is not None:
+    BOOLEAN_ENGINE = "manifold"
+elif "blender" in getattr(trimesh.boolean, "engines_available", set()):
+    BOOLEAN_ENGINE = "blender"
+else:
+    BOOLEAN_ENGINE = None
+
 # Try to import optional text rendering libraries
 try:
     import freetype
-    from shapely.geometry import Polygon, MultiPolygon
-    from shapely.ops import unary_union
+    from shapely.geometry import Point, Polygon
     FREETYPE_AVAILABLE = True
 except ImportError:
     FREETYPE_AVAILABLE = False
@@ -23,6 +35,43 @@ except ImportError:
 class DirectionSignGenerator:
     """Generates 3D models for direction signs."""
     
+    # Unit box corners and outward-wound faces (same layout as trimesh.creation.box)
+    _BOX_CORNERS = np.array([
+        [-1, -1, -1], [-1, -1, 1], [-1, 1, -1], [-1, 1, 1],
+        [1, -1, -1], [1, -1, 1], [1, 1, -1], [1, 1, 1],
+    ], dtype=np.float64)
+    _BOX_FACES = np.array([
+        [1, 3, 0], [4, 1, 0], [0, 3, 2], [2, 4, 0],
+        [1, 7, 3], [5, 1, 4], [5, 7, 1], [3, 7, 2],
+        [6, 4, 2], [2, 7, 6], [6, 5, 4], [7, 5, 6],
+    ], dtype=np.int64)
+    # Turns a cylinder's axis from +Z to +Y (pins stand out of a flat facing +Y)
+    _PIN_AXIS_TO_Y = trimesh.transformations.rotation_matrix(math.radians(90), [1, 0, 0])
+    # Bump when sign geometry changes so cached sign STLs are rebuilt
+    _SIGN_CACHE_VERSION = 1
+    # Binary STL triangle record: normal, three vertices, attribute byte count
+    _STL_RECORD = np.dtype([
+        ('normals', '<f4', (3,)),
+        ('vectors', '<f4', (3, 3)),
+        ('attr', '<u2'),
+    ])
+    # Faces of the right-pointing arrow sign (square end at X=0, tip at X=sign_length)
+    _ARROW_SIGN_FACES = np.array([
+        [0, 2, 1], [0, 3, 2],
+        [0, 1, 5], [0, 5, 4],
+        [3, 6, 2], [3, 7, 6],
+        [0, 4, 7], [0, 7, 3],
+        [1, 2, 6], [1, 6, 5],
+        [4, 5, 8],
+        [7, 9, 6],
+        [4, 8, 9], [4, 9, 7],
+        [5, 6, 9], [5, 9, 8],
+    ], dtype=np.int64)
+    # Shared templates; keep them read-only so no mesh can edit them in place
+    for _template in (_BOX_CORNERS, _BOX_FACES, _PIN_AXIS_TO_Y, _ARROW_SIGN_FACES):
+        _template.flags.writeable = False
+    del _template
+    
     def __init__(self, 
                  post_height: float = 150.0,
                  post_radius: float = 10.0,
@@ -49,6 +98,7 @@ class DirectionSignGenerator:
                  base_text_radius_factor: float = 0.7,
                  base_text_rotation_deg: float = 90.0,
                  base_segments: int = 128,
+                 post_segments: int = 64,
                  base_chamfer: float = 2.0,
                  index_pin_radius: float = 1.0,
                  index_pin_length: float = 2.0,
@@ -67,6 +117,7 @@ class DirectionSignGenerator:
                  join_pin_radius: float = 1.2,
                  join_pin_length: float = 4.0,
                  join_pin_clearance: float = 0.2,
+                 sign_cache_dir: str | None = None,
                  debug: bool = False):
         """
         Initialize the sign generator with dimensions (all in mm).
@@ -97,6 +148,7 @@ class DirectionSignGenerator:
             base_text_radius_factor: Base radius factor for south-side text placement
             base_text_rotation_deg: Z rotation for base text orientation
             base_segments: Number of segments for base cylinders (smoothness)
+            post_segments: Number of segments around the post cylinder; fewer is faster to cut
             base_chamfer: Size of the top chamfer on the base (mm)
             index_pin_radius: Radius of indexing pins on post flats (mm)
             index_pin_length: Length of indexing pins from flat surface (mm)
@@ -115,12 +167,23 @@ class DirectionSignGenerator:
             join_pin_radius: Radius of post-to-post alignment pins (mm)
             join_pin_length: Length of post-to-post alignment pins (mm)
             join_pin_clearance: Radial clearance for post-to-post pin holes (mm)
+            sign_cache_dir: Directory of previously generated sign STLs to reuse (optional)
             debug: Enable verbose debug output
         """
         self.debug = debug
         self._print = print if self.debug else (lambda *args, **kwargs: None)
         self.boolean_overlap = 0.1
-        self._warned_no_boolean_engine = False
+        self._glyph_cache = {}
+        self._glyph_triangulation_cache = {}
+        self._face = None
+        self._font_source = None
+        self._font_missing = False
+        self._text_mesh_cache = {}
+        self._advance_table = None
+        self._unit_circle_cache = {}
+        self._revolved_faces_cache = {}
+        self._cylinder_cache = {}
+        self._placed_mesh_cache = {}
         self.post_height = min(post_height, 150.0)
         self.post_radius = post_radius
         self.base_radius = base_radius
@@ -146,6 +209,7 @@ class DirectionSignGenerator:
         self.base_text_radius_factor = base_text_radius_factor
         self.base_text_rotation_deg = base_text_rotation_deg
         self.base_segments = base_segments
+        self.post_segments = post_segments
         self.base_chamfer = base_chamfer
         self.index_pin_radius = index_pin_radius
         self.index_pin_length = index_pin_length
@@ -164,12 +228,29 @@ class DirectionSignGenerator:
         self.join_pin_radius = join_pin_radius
         self.join_pin_length = join_pin_length
         self.join_pin_clearance = join_pin_clearance
+        self.sign_cache_dir = sign_cache_dir
+
+    def __getstate__(self):
+        """
+        Drop the FreeType face and print hook so the generator can be sent to worker
+        processes; the resolved font source is kept so workers reopen it directly.
+        """
+        state = self.__dict__.copy()
+        state.pop("_print", None)
+        state["_face"] = None
+        return state
 
-    def _get_boolean_engine(self) -> str | None:
-        available = getattr(trimesh.boolean, "engines_available", set())
-        if "manifold" in available:
-            return "manifold"
-        raise RuntimeError("manifold boolean engine not available. Install manifold3d.")
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._print = print if self.debug else (lambda *args, **kwargs: None)
+
+    def _get_boolean_engine(self) -> str:
+        """Return the boolean backend: in-process manifold3d, else Blender if trimesh finds it."""
+        if BOOLEAN_ENGINE is None:
+            raise RuntimeError(
+                "No boolean engine available (install manifold3d, or make Blender visible to trimesh)"
+            )
+        return BOOLEAN_ENGINE
 
     def _prepare_mesh_for_boolean(self, mesh: trimesh.Trimesh) -> trimesh.Trimesh:
         """Return a cleaned mesh for boolean operations."""
@@ -192,46 +273,117 @@ class DirectionSignGenerator:
         )
         target_mesh.apply_transform(rotation_matrix)
 
-    def _create_chamfered_base_mesh(self) -> List[trimesh.Trimesh]:
-        """Create base meshes with a top chamfer."""
+    def _create_cylinder(self, radius: float, height: float, sections: int,
+                         transform: np.ndarray | None = None) -> trimesh.Trimesh:
+        """
+        Create a Z-axis cylinder centered at the origin, then apply transform.
+        Each (radius, height, sections) shape is tessellated once and copied after that.
+        """
+        key = (radius, height, sections)
+        template = self._cylinder_cache.get(key)
+        if template is None:
+            template = trimesh.creation.cylinder(radius=radius, height=height, sections=sections)
+            template = (np.array(template.vertices), np.array(template.faces))
+            for array in template:
+                array.flags.writeable = False
+            self._cylinder_cache[key] = template
+        vertices, faces = template
+        if transform is None:
+            vertices = vertices.copy()
+        else:
+            vertices = vertices @ transform[:3, :3].T + transform[:3, 3]
+        return trimesh.Trimesh(vertices=vertices, faces=faces.copy(), process=False)
+
+    def _create_chamfered_base_mesh(self) -> trimesh.Trimesh:
+        """Create the base as a single solid with a top chamfer."""
         chamfer = max(0.0, min(self.base_chamfer, self.base_height))
         if chamfer <= 0.0:
-            base = trimesh.creation.cylinder(
-                radius=self.base_radius,
-                height=self.base_height,
-                sections=self.base_segments
-            )
-            base.apply_translation([0, 0, self.base_height / 2])
-            return [base]
+            profile = [(self.base_radius, 0.0), (self.base_radius, self.base_height)]
+            return self._create_revolved_mesh(profile, self.base_segments)
 
         bottom_height = self.base_height - chamfer
-        bottom = trimesh.creation.cylinder(
-            radius=self.base_radius,
-            height=bottom_height,
-            sections=self.base_segments
-        )
-        bottom.apply_translation([0, 0, bottom_height / 2])
-
-        frustum = trimesh.creation.cylinder(
-            radius=self.base_radius,
-            height=chamfer,
-            sections=self.base_segments
-        )
-        z_min = -chamfer / 2
-        z_max = chamfer / 2
         top_radius = max(self.base_radius - chamfer, 0.1)
-        top_scale = top_radius / self.base_radius
-        vertices = frustum.vertices.copy()
-        for i in range(len(vertices)):
-            z = vertices[i][2]
-            t = (z - z_min) / (z_max - z_min)
-            scale = 1.0 + (top_scale - 1.0) * t
-            vertices[i][0] *= scale
-            vertices[i][1] *= scale
-        frustum.vertices = vertices
-        frustum.apply_translation([0, 0, bottom_height + chamfer / 2])
-
-        return [bottom, frustum]
+        profile = [(self.base_radius, 0.0)]
+        if bottom_height > 0.0:
+            profile.append((self.base_radius, bottom_height))
+        profile.append((top_radius, self.base_height))
+        return self._create_revolved_mesh(profile, self.base_segments)
+
+    def _unit_circle(self, sections: int) -> np.ndarray:
+        """Return (sections, 2) cos/sin samples of the unit circle, computed once per count."""
+        ring = self._unit_circle_cache.get(sections)
+        if ring is None:
+            theta = np.linspace(0.0, 2.0 * np.pi, sections, endpoint=False)
+            ring = np.column_stack([np.cos(theta), np.sin(theta)])
+            ring.flags.writeable = False
+            self._unit_circle_cache[sections] = ring
+        return ring
+
+    def _create_revolved_mesh(self, profile: List[Tuple[float, float]],
+                              sections: int) -> trimesh.Trimesh:
+        """
+        Build a closed solid of revolution around the Z axis directly from vertex/face arrays.
+        The profile is a list of (radius, z) rings ordered from bottom to top.
+        """
+        ring = self._unit_circle(sections)
+        ring_count = len(profile)
+        # Vertex 0/1 are the bottom/top centers, followed by each ring in profile order
+        vertices = np.empty((2 + ring_count * sections, 3))
+        vertices[0] = [0.0, 0.0, profile[0][1]]
+        vertices[1] = [0.0, 0.0, profile[-1][1]]
+        for k, (radius, z) in enumerate(profile):
+            start = 2 + k * sections
+            vertices[start:start + sections, :2] = ring * radius
+            vertices[start:start + sections, 2] = z
+        faces = self._revolved_faces(sections, ring_count)
+        return trimesh.Trimesh(vertices=vertices, faces=faces.copy(), process=False)
+
+    def _create_tube_mesh(self, inner_radius: float, outer_radius: float,
+                          z_bottom: float, z_top: float, sections: int) -> trimesh.Trimesh:
+        """Build a closed annular tube around the Z axis without a boolean difference."""
+        ring = self._unit_circle(sections)
+        # Closed (radius, z) loop: up the outer wall, across the top, down the inner wall
+        profile = [(outer_radius, z_bottom), (outer_radius, z_top),
+                   (inner_radius, z_top), (inner_radius, z_bottom)]
+        vertices = np.empty((len(profile) * sections, 3))
+        for k, (radius, z) in enumerate(profile):
+            vertices[k * sections:(k + 1) * sections, :2] = ring * radius
+            vertices[k * sections:(k + 1) * sections, 2] = z
+        i = np.arange(sections)
+        nxt = (i + 1) % sections
+        blocks = []
+        for k in range(len(profile)):
+            lower = k * sections
+            upper = ((k + 1) % len(profile)) * sections
+            blocks.append(np.column_stack([lower + i, lower + nxt, upper + i]))
+            blocks.append(np.column_stack([upper + i, lower + nxt, upper + nxt]))
+        return trimesh.Trimesh(vertices=vertices, faces=np.concatenate(blocks), process=False)
+
+    def _revolved_faces(self, sections: int, ring_count: int) -> np.ndarray:
+        """Face topology of a revolved solid; depends only on the counts, so built once."""
+        key = (sections, ring_count)
+        cached = self._revolved_faces_cache.get(key)
+        if cached is not None:
+            return cached
+        i = np.arange(sections)
+        cur = 2 + i
+        nxt = 2 + (i + 1) % sections
+        top_offset = (ring_count - 1) * sections
+        blocks = [
+            np.column_stack([np.zeros_like(i), nxt, cur]),
+            np.column_stack([np.ones_like(i), cur + top_offset, nxt + top_offset]),
+        ]
+        for k in range(ring_count - 1):
+            lower_cur = cur + k * sections
+            lower_next = nxt + k * sections
+            upper_cur = lower_cur + sections
+            upper_next = lower_next + sections
+            blocks.append(np.column_stack([lower_cur, lower_next, upper_cur]))
+            blocks.append(np.column_stack([upper_cur, lower_next, upper_next]))
+        faces = np.concatenate(blocks)
+        faces.flags.writeable = False
+        self._revolved_faces_cache[key] = faces
+        return faces
 
     def _center_mesh_xy(self, target_mesh: trimesh.Trimesh) -> None:
         """Center a mesh in the XY plane, preserving Z."""
@@ -251,33 +403,33 @@ class DirectionSignGenerator:
         vertices = text_mesh.vertices.copy()
         z_min = base_z
         z_max = base_z + ramp_height
-        for i in range(len(vertices)):
-            z = vertices[i][2]
-            if z <= z_min:
-                scale = self.text_ramp_scale
-            elif z >= z_max:
-                scale = 1.0
-            else:
-                t = (z - z_min) / (z_max - z_min)
-                scale = self.text_ramp_scale - (self.text_ramp_scale - 1.0) * t
-            vertices[i][0] = center_x + (vertices[i][0] - center_x) * scale
-            vertices[i][1] = center_y + (vertices[i][1] - center_y) * scale
+        # Full ramp scale at/below z_min, easing linearly to 1.0 at/above z_max
+        t = np.clip((vertices[:, 2] - z_min) / (z_max - z_min), 0.0, 1.0)
+        scale = self.text_ramp_scale - (self.text_ramp_scale - 1.0) * t
+        center = np.array([center_x, center_y])
+        vertices[:, :2] = center + (vertices[:, :2] - center) * scale[:, None]
         text_mesh.vertices = vertices
 
+    def _concatenate_meshes(self, meshes: List[trimesh.Trimesh]) -> trimesh.Trimesh:
+        """Stack mesh vertex/face arrays into one mesh (offsetting face indices) without processing."""
+        vertices = np.vstack([m.vertices for m in meshes])
+        counts = [len(m.vertices) for m in meshes]
+        offsets = np.cumsum([0] + counts[:-1])
+        # Stack the raw faces, then offset every block with one broadcast add
+        faces = np.vstack([m.faces for m in meshes])
+        faces += np.repeat(offsets, [len(m.faces) for m in meshes])[:, None]
+        return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+
     def _union_meshes(self, meshes: List[trimesh.Trimesh]) -> trimesh.Trimesh:
         """Boolean-union meshes into a single solid; fall back to concat on failure."""
         if not meshes:
             raise ValueError("No meshes to union")
         engine = self._get_boolean_engine()
-        if engine is None and not self._warned_no_boolean_engine:
-            self._print("  Warning: No boolean engine available; meshes may remain separate shells")
-            self._warned_no_boolean_engine = True
-        if engine is None:
-            return trimesh.util.concatenate(meshes)
+        # Inputs are authored, unprocessed meshes; only clean them up if the
+        # direct union fails.
         try:
-            cleaned_meshes = [self._prepare_mesh_for_boolean(m) for m in meshes]
             unioned = trimesh.boolean.union(
-                cleaned_meshes,
+                meshes,
                 engine=engine,
                 use_exact=False,
                 check_volume=False,
@@ -285,9 +437,13 @@ class DirectionSignGenerator:
             )
             if unioned is not None and len(unioned.faces) > 0:
                 return unioned
-            self._print("  Warning: Boolean union returned empty mesh; retrying exact mode")
+            self._print("  Warning: Boolean union returned empty mesh; retrying with cleaned meshes")
+        except Exception as e:
+            self._print(f"  Warning: Boolean union failed: {e}; retrying with cleaned meshes")
+        try:
+            cleaned_meshes = [self._prepare_mesh_for_boolean(m) for m in meshes]
             unioned = trimesh.boolean.union(
-                meshes,
+                cleaned_meshes,
                 engine=engine,
                 use_exact=True,
                 use_self=True,
@@ -299,7 +455,71 @@ class DirectionSignGenerator:
             self._print("  Warning: Boolean union returned empty mesh; falling back to concat")
         except Exception as e:
             self._print(f"  Warning: Boolean union failed: {e}")
-        return trimesh.util.concatenate(meshes)
+        return self._concatenate_meshes(meshes)
+
+    def _export_stl(self, target_mesh: trimesh.Trimesh, output_path: str) -> None:
+        """Write a mesh as binary STL straight from its arrays."""
+        # trimesh keeps float64 vertices; STL stores float32, so this is the single
+        # downcast. Every field is written below, so the record buffer is not zeroed.
+        data = np.empty(len(target_mesh.faces), dtype=self._STL_RECORD)
+        vertices = np.asarray(target_mesh.vertices, dtype=np.float32)
+        triangles = data['vectors']
+        np.take(vertices, target_mesh.faces, axis=0, out=triangles)
+        # Normals straight from the packed triangles; degenerate faces keep a zero normal
+        normals = np.cross(triangles[:, 1] - triangles[:, 0], triangles[:, 2] - triangles[:, 0])
+        lengths = np.linalg.norm(normals, axis=1, keepdims=True)
+        np.divide(normals, lengths, out=normals, where=lengths > 0)
+        data['normals'] = normals
+        data['attr'] = 0
+        # 80-byte header (must not start with "solid"), uint32 count, packed records
+        with open(output_path, "wb") as handle:
+            handle.write(self._stl_header(output_path))
+            handle.write(np.uint32(len(data)).tobytes())
+            data.tofile(handle)
+
+    def _stl_header(self, output_path: str) -> bytes:
+        """80-byte binary STL header naming the output file."""
+        header = f"BearingPost {os.path.basename(output_path)}".encode("ascii", "replace")[:80]
+        return header.ljust(80, b" ")
+
+    def _sign_cache_path(self, text: str, distance: str, arrowed: bool, point_left: bool,
+                         segment_id: int | None) -> str:
+        """
+        Cache file for a sign: a hash of everything its geometry depends on, i.e.
+        the sign arguments, every public dimension of this generator and the
+        resolved font file (path, face index, size and modification time).
+        """
+        settings = sorted(
+            (name, value) for name, value in self.__dict__.items()
+            if not name.startswith("_") and name not in ("debug", "sign_cache_dir")
+        )
+        font = None
+        if FREETYPE_AVAILABLE:
+            try:
+                self._get_font_face()
+                font_path, face_index = self._font_source
+                font_stat = os.stat(font_path)
+                font = (font_path, face_index, font_stat.st_size, font_stat.st_mtime_ns)
+            except (RuntimeError, OSError):
+                font = None
+        key = repr((self._SIGN_CACHE_VERSION, font, text, distance,
+                    arrowed, point_left, segment_id, settings))
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+        return os.path.join(self.sign_cache_dir, f"sign_{digest}.stl")
+
+    def _difference_meshes(self, target: trimesh.Trimesh,
+                           cutters: List[trimesh.Trimesh]) -> trimesh.Trimesh:
+        """Subtract a list of cutters from a mesh in a single boolean call."""
+        engine = self._get_boolean_engine()
+        # Inputs are authored closed solids; skip trimesh's per-mesh volume validation
+        return trimesh.boolean.difference([target] + list(cutters), engine=engine,
+                                          check_volume=False)
+
+    def _check_cutters(self, cutters: List[trimesh.Trimesh], label: str) -> None:
+        """Debug check that every cutter is a closed solid before it reaches the boolean."""
+        for index, cutter in enumerate(cutters):
+            if not cutter.is_watertight or cutter.volume <= 0:
+                raise ValueError(f"{label} cutter {index} is not a closed positive-volume solid")
 
     def _log_components(self, mesh: trimesh.Trimesh, label: str) -> None:
         """Log connected component count for debugging union results."""
@@ -329,55 +549,66 @@ class DirectionSignGenerator:
             center_x = (bounds[0][0] + bounds[1][0]) / 2
             line_mesh.apply_translation([-center_x, y_pos, 0])
             meshes.append(line_mesh)
-        text_mesh = trimesh.util.concatenate(meshes)
-        # Mirror so the text reads correctly from the bottom.
-        text_mesh.apply_scale([1, -1, 1])
-        # Scale the extrude height to the engraving depth (keep bottom at Z=0).
+        text_mesh = self._concatenate_meshes(meshes)
+        # Mirror so the text reads correctly from the bottom, and scale the
+        # extrude height to the engraving depth (keep bottom at Z=0).
         z_scale = engraving_depth / max(self.text_height, 0.01)
-        text_mesh.apply_scale([1, 1, z_scale])
+        text_mesh.apply_scale([1, -1, z_scale])
         return text_mesh
 
     def _create_index_pin_at_bearing(self, bearing: float, sign_height: float,
                                      post_x_offset: float, post_y_offset: float) -> trimesh.Trimesh:
         """Create an indexing pin on the flat spot at a specific bearing."""
-        pin = trimesh.creation.cylinder(
-            radius=self.index_pin_radius,
-            height=self.index_pin_length,
-            sections=24
-        )
-        # Rotate cylinder axis from +Z to +Y for bearing 0.
-        pin.apply_transform(trimesh.transformations.rotation_matrix(
-            math.radians(90), [1, 0, 0]
-        ))
-        # Place pin so it protrudes from the flat surface and overlaps the post.
-        radial_center = self.post_radius - self.flat_depth + (self.index_pin_length / 2) - self.boolean_overlap
-        pin.apply_translation([0, radial_center, sign_height])
-        # Rotate around post center by bearing (match box subtraction orientation).
-        rotation_matrix = trimesh.transformations.rotation_matrix(
-            math.radians(-bearing), [0, 0, 1], [0, 0, 0]
-        )
-        pin.apply_transform(rotation_matrix)
-        pin.apply_translation([post_x_offset, post_y_offset, 0])
-        return pin
-
-    def _create_index_hole_for_sign(self, sign_length: float, sign_height: float,
-                                    point_left: bool) -> trimesh.Trimesh:
-        """Create a matching indexing hole on the sign backside."""
-        hole_radius = self.index_pin_radius + self.index_pin_clearance
-        hole_depth = min(self.sign_thickness, self.index_pin_length + self.index_pin_clearance)
-        hole = trimesh.creation.cylinder(
-            radius=hole_radius,
-            height=hole_depth,
-            sections=24
-        )
-        x_pos = sign_length / 2
-        y_pos = sign_height / 2
-        hole.apply_translation([x_pos, y_pos, hole_depth / 2])
-        return hole
+        def build() -> trimesh.Trimesh:
+            # Place pin so it protrudes from the flat surface and overlaps the post.
+            radial_center = self.post_radius - self.flat_depth + (self.index_pin_length / 2) - self.boolean_overlap
+            placement = self._bearing_placement(bearing, post_x_offset, post_y_offset)
+            transform = self._flat_pin_transform(placement, radial_center, sign_height)
+            return self._create_cylinder(self.index_pin_radius, self.index_pin_length, 24, transform)
+        return self._placed_mesh("index_pin", bearing, sign_height, post_x_offset, post_y_offset, build)
+
+    def _placed_mesh(self, kind: str, bearing: float, height: float,
+                     post_x_offset: float, post_y_offset: float, build) -> trimesh.Trimesh:
+        """
+        Return a fresh copy of a primitive placed at a bearing and height on the post,
+        calling build() only the first time that placement is requested.
+        """
+        key = (kind, round(bearing % 360.0, 3), round(height, 3), post_x_offset, post_y_offset)
+        cached = self._placed_mesh_cache.get(key)
+        if cached is None:
+            placed = build()
+            cached = (np.array(placed.vertices), np.array(placed.faces))
+            for array in cached:
+                array.flags.writeable = False
+            self._placed_mesh_cache[key] = cached
+        vertices, faces = cached
+        return trimesh.Trimesh(vertices=vertices.copy(), faces=faces.copy(), process=False)
+
+    def _bearing_placement(self, bearing: float, post_x_offset: float,
+                           post_y_offset: float) -> np.ndarray:
+        """
+        Rotation about the post axis by bearing (matching the flat cut), then the
+        offset to the post center. Shared by every pin on one flat.
+        """
+        placement = trimesh.transformations.rotation_matrix(math.radians(-bearing), [0, 0, 1])
+        placement[:2, 3] = [post_x_offset, post_y_offset]
+        return placement
+
+    def _flat_pin_transform(self, placement: np.ndarray, radial_center: float,
+                            z: float) -> np.ndarray:
+        """
+        Compose the placement of a pin standing out of a flat: turn the cylinder
+        axis from +Z to +Y, move it out to the flat at height z, then apply the
+        flat's bearing placement.
+        """
+        local = self._PIN_AXIS_TO_Y.copy()
+        local[1, 3] = radial_center
+        local[2, 3] = z
+        return placement @ local
 
     def _create_id_pins_at_bearing(self, bearing: float, sign_height: float,
                                    post_x_offset: float, post_y_offset: float,
-                                   segment_id: int) -> trimesh.Trimesh:
+                                   segment_id: int) -> List[trimesh.Trimesh]:
         """Create up to 4 ID pins (binary) on the flat spot for a segment ID (1-15)."""
         if segment_id <= 0 or segment_id > 15:
             raise ValueError(f"segment_id must be 1-15, got {segment_id}")
@@ -388,55 +619,39 @@ class DirectionSignGenerator:
             1.5 * self.id_pin_spacing,
         ]
         pin_meshes = []
+        radial_center = self.post_radius - self.flat_depth + (self.id_pin_length / 2) - self.boolean_overlap
+        placement = self._bearing_placement(bearing, post_x_offset, post_y_offset)
         for bit_index, x_offset in enumerate(pin_offsets):
             if not (segment_id & (1 << bit_index)):
                 continue
-            pin = trimesh.creation.cylinder(
-                radius=self.id_pin_radius,
-                height=self.id_pin_length,
-                sections=24
-            )
-            pin.apply_transform(trimesh.transformations.rotation_matrix(
-                math.radians(90), [1, 0, 0]
-            ))
-            radial_center = self.post_radius - self.flat_depth + (self.id_pin_length / 2) - self.boolean_overlap
-            pin.apply_translation([0, radial_center, sign_height + x_offset])
-            rotation_matrix = trimesh.transformations.rotation_matrix(
-                math.radians(-bearing), [0, 0, 1], [0, 0, 0]
-            )
-            pin.apply_transform(rotation_matrix)
-            pin.apply_translation([post_x_offset, post_y_offset, 0])
-            pin_meshes.append(pin)
-        return trimesh.util.concatenate(pin_meshes)
-
-    def _create_id_holes_for_sign(self, sign_length: float, sign_height: float,
-                                  point_left: bool, segment_id: int) -> List[trimesh.Trimesh]:
-        """Create matching ID pin holes on the sign backside."""
-        if segment_id <= 0 or segment_id > 15:
-            raise ValueError(f"segment_id must be 1-15, got {segment_id}")
-        hole_radius = self.id_pin_radius + self.id_pin_clearance
-        hole_depth = min(self.sign_thickness, self.id_pin_length + self.id_pin_clearance)
-        pin_offsets = [
-            -1.5 * self.id_pin_spacing,
-            -0.5 * self.id_pin_spacing,
-            0.5 * self.id_pin_spacing,
-            1.5 * self.id_pin_spacing,
-        ]
-        x_base = sign_length / 2
-        holes = []
-        for bit_index, x_offset in enumerate(pin_offsets):
-            if not (segment_id & (1 << bit_index)):
-                continue
-            hole = trimesh.creation.cylinder(
-                radius=hole_radius,
-                height=hole_depth,
-                sections=24
-            )
-            x_pos = x_base
-            y_pos = sign_height / 2 + x_offset
-            hole.apply_translation([x_pos, y_pos, hole_depth / 2])
-            holes.append(hole)
-        return holes
+            transform = self._flat_pin_transform(placement, radial_center, sign_height + x_offset)
+            pin_meshes.append(self._create_cylinder(self.id_pin_radius, self.id_pin_length, 24, transform))
+        return pin_meshes
+
+    def _sign_hole_layout(self, sign_length: float, sign_height: float,
+                          segment_id: int | None) -> Tuple[np.ndarray, float, float] | None:
+        """
+        Centers, radius and depth of the pin holes on the sign backside: the binary
+        ID holes for segment IDs 1-15, otherwise a single center index hole.
+        Returns None (no holes) for a non-positive segment ID, which matches no post slot.
+        """
+        if segment_id is not None and segment_id <= 0:
+            self._print(f"  Warning: segment_id must be 1-15, got {segment_id}; no index hole cut")
+            return None
+        center = np.array([sign_length / 2, sign_height / 2])
+        if segment_id is not None and segment_id <= 15:
+            pin_offsets = np.array([-1.5, -0.5, 0.5, 1.5]) * self.id_pin_spacing
+            bits = ((segment_id >> np.arange(4)) & 1) == 1
+            centers = center + np.column_stack([np.zeros(bits.sum()), pin_offsets[bits]])
+            radius = self.id_pin_radius + self.id_pin_clearance
+            depth = min(self.sign_thickness, self.id_pin_length + self.id_pin_clearance)
+        else:
+            if segment_id is not None and segment_id > 15:
+                self._print(f"  Note: segment_id {segment_id} exceeds 15; using center hole only")
+            centers = center[None, :]
+            radius = self.index_pin_radius + self.index_pin_clearance
+            depth = min(self.sign_thickness, self.index_pin_length + self.index_pin_clearance)
+        return centers, radius, depth
 
     def _split_distance_text(self, distance_text: str) -> Tuple[str, str]:
         """Split distance into value and units for two-line display."""
@@ -447,7 +662,8 @@ class DirectionSignGenerator:
             return " ".join(parts[:-1]), parts[-1]
         return distance_text.strip(), ""
     
-    def generate_post(self, bearings: List, output_path: str, home_lat: float = None, home_lon: float = None):
+    def generate_post(self, bearings: List, output_path: str, home_lat: float = None, home_lon: float = None,
+                      max_workers: int | None = None):
         """
         Generate a two-part post with flats for signs, splitting the signs across the
         two post parts from top to bottom. The first sign is at the very top of the
@@ -459,111 +675,122 @@ class DirectionSignGenerator:
             output_path: Path to save the STL file
             home_lat: Home latitude to emboss on base (optional)
             home_lon: Home longitude to emboss on base (optional)
+            max_workers: Worker process count (defaults to up to 2 by CPU count); 1 builds
+                both parts in-process, otherwise the upper post is built in a worker
+                while the lower post is built here
         """
         self._print(f"Generating two-part post with {len(bearings)} sign slots...")
         
-        # Configuration
-        segments = 64
-        sign_vertical_spacing = self.sign_vertical_spacing
-        sign_gap_half = sign_vertical_spacing / 2
-        segment_height = self.flat_height + sign_vertical_spacing
-        
+        segment_height = self.flat_height + self.sign_vertical_spacing
         output_base = os.path.splitext(output_path)[0]
 
         entries = list(bearings)
 
-        def max_slots_per_post(post_height: float) -> int:
-            if post_height <= 0:
-                return 0
-            return max(1, int(math.floor(post_height / segment_height)))
-
-        upper_capacity = max_slots_per_post(self.post_height)
+        upper_capacity = self._max_slots_per_post(self.post_height)
         split_index = min(len(entries), upper_capacity)
         upper_entries = entries[:split_index]
         lower_entries = entries[split_index:]
 
-        def slot_centers(post_height: float, count: int, anchor: str) -> List[float]:
-            if count <= 0:
-                return []
-            half_segment = segment_height / 2
-            if anchor == "bottom":
-                centers = [half_segment + i * segment_height for i in range(count)]
-                return list(reversed(centers))
-            top_center = post_height - half_segment
-            return [top_center - i * segment_height for i in range(count)]
-
-        def build_post(entries: List, post_height: float, base_index: int,
-                       add_join_pins: bool, cut_join_holes: bool) -> trimesh.Trimesh:
-            post_mesh = trimesh.creation.cylinder(
-                radius=self.post_radius,
-                height=post_height,
-                sections=segments
-            )
-            post_mesh.apply_translation([0, 0, post_height / 2])
-            add_meshes = []
-            anchor = "bottom" if cut_join_holes else "top"
-            centers = slot_centers(post_height, len(entries), anchor)
-            for i, (entry, sign_center) in enumerate(zip(entries, centers)):
-                if isinstance(entry, dict):
-                    bearing = entry.get("bearing")
-                    segment_id = entry.get("segment_id")
-                    is_spacer = entry.get("spacer", False)
-                else:
-                    bearing = entry
-                    segment_id = base_index + i + 1
-                    is_spacer = False
+        post_height = max(self.post_height, segment_height)
+        lower_path = f"{output_base}_post_lower.stl"
+        upper_path = f"{output_base}_post_upper.stl"
+
+        if max_workers is None:
+            max_workers = min(2, os.cpu_count() or 1)
+        if max_workers <= 1:
+            self._generate_lower_post(lower_entries, post_height, split_index, lower_path,
+                                      home_lat, home_lon)
+            self._generate_upper_post(upper_entries, post_height, upper_path)
+            return
+        # The two parts share nothing; build the upper post in a worker meanwhile
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            upper_future = pool.submit(self._generate_upper_post, upper_entries,
+                                       post_height, upper_path)
+            self._generate_lower_post(lower_entries, post_height, split_index, lower_path,
+                                      home_lat, home_lon)
+            upper_future.result()
+
+    def _max_slots_per_post(self, post_height: float) -> int:
+        """Number of sign flats that fit on a post part of the given height."""
+        if post_height <= 0:
+            return 0
+        segment_height = self.flat_height + self.sign_vertical_spacing
+        return max(1, int(math.floor(post_height / segment_height)))
+
+    def _slot_centers(self, post_height: float, count: int, anchor: str) -> List[float]:
+        """Z centers of the sign flats, packed against the top or bottom of a post part."""
+        if count <= 0:
+            return []
+        segment_height = self.flat_height + self.sign_vertical_spacing
+        half_segment = segment_height / 2
+        if anchor == "bottom":
+            centers = [half_segment + i * segment_height for i in range(count)]
+            return list(reversed(centers))
+        top_center = post_height - half_segment
+        return [top_center - i * segment_height for i in range(count)]
+
+    def _build_post(self, entries: List, post_height: float, base_index: int,
+                    add_join_pins: bool,
+                    cut_join_holes: bool) -> Tuple[trimesh.Trimesh, List[trimesh.Trimesh]]:
+        """Cut the flats into a post body; return it with the meshes still to be unioned."""
+        post_mesh = self._create_cylinder(
+            radius=self.post_radius,
+            height=post_height,
+            sections=self.post_segments,
+            transform=trimesh.transformations.translation_matrix([0, 0, post_height / 2])
+        )
+        add_meshes = []
+        cutters = []
+        anchor = "bottom" if cut_join_holes else "top"
+        centers = self._slot_centers(post_height, len(entries), anchor)
+        for i, (entry, sign_center) in enumerate(zip(entries, centers)):
+            if isinstance(entry, dict):
+                bearing = entry.get("bearing")
+                segment_id = entry.get("segment_id")
+                is_spacer = entry.get("spacer", False)
+            else:
+                bearing = entry
+                segment_id = base_index + i + 1
+                is_spacer = False
+            if self.debug:
                 label = f"{segment_id}" if segment_id is not None else "spacer"
                 self._print(f"    Slot {i+1}: bearing {bearing} (ID {label})")
-                if is_spacer or bearing is None:
-                    continue
-                adjusted_bearing = (bearing + 90.0) % 360.0
-                box_mesh = self._create_box_mesh_at_bearing(adjusted_bearing, sign_center, 0, 0)
-                try:
-                    new_mesh = post_mesh.difference(box_mesh)
-                    if new_mesh is not None and len(new_mesh.faces) > 0:
-                        post_mesh = new_mesh
-                    else:
-                        self._print("      Warning: Flat boolean returned empty mesh")
-                except Exception as e:
-                    self._print(f"      Warning: Flat boolean failed: {e}")
-
-                if segment_id is not None and segment_id <= 15:
-                    id_pin_mesh = self._create_id_pins_at_bearing(
-                        adjusted_bearing, sign_center, 0, 0, segment_id
-                    )
-                    add_meshes.append(id_pin_mesh)
-                else:
-                    if segment_id is not None and segment_id > 15:
-                        self._print(f"      Note: segment_id {segment_id} exceeds 15; using center pin only")
-                    center_pin_mesh = self._create_index_pin_at_bearing(adjusted_bearing, sign_center, 0, 0)
-                    add_meshes.append(center_pin_mesh)
-
-            if cut_join_holes:
-                join_holes = self._create_post_join_pin_holes()
-                try:
-                    new_mesh = post_mesh.difference(join_holes)
-                    if new_mesh is not None and len(new_mesh.faces) > 0:
-                        post_mesh = new_mesh
-                    else:
-                        self._print("      Warning: Join pin holes returned empty mesh")
-                except Exception as e:
-                    self._print(f"      Warning: Join pin holes failed: {e}")
-
-            if add_join_pins:
-                add_meshes.append(self._create_post_join_pins(post_height))
-
-            if add_meshes:
-                post_mesh = self._union_meshes([post_mesh] + add_meshes)
-            return post_mesh
+            if is_spacer or bearing is None:
+                continue
+            adjusted_bearing = (bearing + 90.0) % 360.0
+            cutters.append(self._create_box_mesh_at_bearing(adjusted_bearing, sign_center, 0, 0))
 
-        post_height = max(self.post_height, segment_height)
-        upper_height = post_height
-        lower_height = post_height
+            if segment_id is not None and segment_id <= 15:
+                id_pin_meshes = self._create_id_pins_at_bearing(
+                    adjusted_bearing, sign_center, 0, 0, segment_id
+                )
+                add_meshes.extend(id_pin_meshes)
+            else:
+                if segment_id is not None and segment_id > 15:
+                    self._print(f"      Note: segment_id {segment_id} exceeds 15; using center pin only")
+                center_pin_mesh = self._create_index_pin_at_bearing(adjusted_bearing, sign_center, 0, 0)
+                add_meshes.append(center_pin_mesh)
 
-        # ===== LOWER POST (BASE + POST) =====
+        if cut_join_holes:
+            cutters.extend(self._create_post_join_pin_holes())
+
+        # Cut every flat and join hole in one boolean pass
+        if cutters:
+            if self.debug:
+                self._check_cutters(cutters, "flat")
+            post_mesh = self._difference_meshes(post_mesh, cutters)
+
+        if add_join_pins:
+            add_meshes.extend(self._create_post_join_pins(post_height))
+
+        return post_mesh, add_meshes
+
+    def _generate_lower_post(self, entries: List, post_height: float, base_index: int,
+                             output_path: str, home_lat: float = None,
+                             home_lon: float = None) -> str:
+        """Build the base and lower post part and save it; returns the output path."""
         self._print("  Creating lower post...")
-        base_meshes = self._create_chamfered_base_mesh()
-        base_mesh = trimesh.util.concatenate(base_meshes)
+        base_mesh = self._create_chamfered_base_mesh()
 
         # Engrave maker text on the bottom of the base.
         if FREETYPE_AVAILABLE:
@@ -572,7 +799,7 @@ class DirectionSignGenerator:
             try:
                 engraving_depth = 0.6
                 text_mesh = self._create_base_bottom_text_mesh(maker_lines, engraving_depth)
-                new_mesh = base_mesh.difference(text_mesh)
+                new_mesh = self._difference_meshes(base_mesh, [text_mesh])
                 if new_mesh is not None and len(new_mesh.faces) > 0:
                     base_mesh = new_mesh
             except Exception:
@@ -584,28 +811,36 @@ class DirectionSignGenerator:
             coords_meshes = self._create_coordinates_text(home_lat, home_lon)
         compass_meshes = self._create_compass_decorations()
 
-        lower_post = build_post(lower_entries, lower_height, split_index, add_join_pins=True, cut_join_holes=False)
-        lower_post.apply_translation([0, 0, self.base_height])
+        lower_post, lower_pins = self._build_post(entries, post_height, base_index,
+                                                  add_join_pins=True, cut_join_holes=False)
+        for part in [lower_post] + lower_pins:
+            part.apply_translation([0, 0, self.base_height])
 
-        lower_meshes = [base_mesh, arrow_mesh, lower_post]
+        # Union every lower part in one pass rather than unioning the post
+        # with its pins first and then again with the base.
+        lower_meshes = [base_mesh, arrow_mesh, lower_post] + lower_pins
         if compass_meshes:
             lower_meshes.extend(compass_meshes)
         if coords_meshes:
             lower_meshes.extend(coords_meshes)
         lower_segment = self._union_meshes(lower_meshes)
         self._log_components(lower_segment, "lower post")
-        lower_path = f"{output_base}_post_lower.stl"
-        lower_segment.export(lower_path)
-        self._print(f"  Saved: {lower_path}")
+        self._export_stl(lower_segment, output_path)
+        self._print(f"  Saved: {output_path}")
+        return output_path
 
-        # ===== UPPER POST =====
+    def _generate_upper_post(self, entries: List, post_height: float, output_path: str) -> str:
+        """Build the upper post part and save it; returns the output path."""
         self._print("  Creating upper post...")
-        upper_post = build_post(upper_entries, upper_height, 0, add_join_pins=False, cut_join_holes=True)
+        upper_post, upper_pins = self._build_post(entries, post_height, 0,
+                                                  add_join_pins=False, cut_join_holes=True)
+        if upper_pins:
+            upper_post = self._union_meshes([upper_post] + upper_pins)
         self._log_components(upper_post, "upper post")
-        upper_path = f"{output_base}_post_upper.stl"
-        upper_post.export(upper_path)
-        self._print(f"  Saved: {upper_path}")
-    
+        self._export_stl(upper_post, output_path)
+        self._print(f"  Saved: {output_path}")
+        return output_path
+
     def _create_north_arrow(self) -> trimesh.Trimesh:
         """
         Create a north indicator mesh ("N") to sit on top of the base.
@@ -631,22 +866,20 @@ class DirectionSignGenerator:
             # Build a blocky "N" in the XY plane, then extrude in Z.
             z_center = self.base_height - self.boolean_overlap + letter_thickness / 2
             y_center = letter_height / 2
-            left_bar = trimesh.creation.box(extents=[stroke, letter_height, letter_thickness])
-            left_bar.apply_translation([-letter_width / 2 + stroke / 2, y_center, z_center])
-            
-            right_bar = trimesh.creation.box(extents=[stroke, letter_height, letter_thickness])
-            right_bar.apply_translation([letter_width / 2 - stroke / 2, y_center, z_center])
-            
+            bar_x = letter_width / 2 - stroke / 2
             diag_length = math.hypot(letter_height - stroke, letter_width - stroke)
-            diag_bar = trimesh.creation.box(extents=[stroke, diag_length, letter_thickness])
             diag_angle = math.atan2(letter_width - stroke, letter_height - stroke)
-            diag_bar.apply_transform(trimesh.transformations.rotation_matrix(diag_angle, [0, 0, 1]))
-            diag_bar.apply_translation([0, y_center, z_center])
-            
-            letter_mesh = trimesh.util.concatenate([left_bar, right_bar, diag_bar])
-            
-            # Rotate another 90° so the letter orientation matches the coordinate text.
-            self._rotate_mesh_z(letter_mesh, 90, (0, 0, z_center))
+            # Left bar, right bar, diagonal, each turned a further 90° about the Z axis
+            # (x, y) -> (-y, x) so the letter orientation matches the coordinate text.
+            letter_mesh = self._create_boxes_mesh(
+                [[stroke, letter_height, letter_thickness],
+                 [stroke, letter_height, letter_thickness],
+                 [stroke, diag_length, letter_thickness]],
+                [[-y_center, -bar_x, z_center],
+                 [-y_center, bar_x, z_center],
+                 [-y_center, 0, z_center]],
+                np.array([0.0, 0.0, diag_angle]) + math.pi / 2,
+            )
         
         # Position on the base top at north (+Y).
         base_y = self.base_radius * 0.7
@@ -686,17 +919,9 @@ class DirectionSignGenerator:
         ring_height = 0.6
         outer_radius = self.base_radius * 0.9
         inner_radius = self.base_radius * 0.85
-        try:
-            outer = trimesh.creation.cylinder(radius=outer_radius, height=ring_height, sections=self.base_segments)
-            inner = trimesh.creation.cylinder(radius=inner_radius, height=ring_height, sections=self.base_segments)
-            z_center = self.base_height - self.boolean_overlap + ring_height / 2
-            outer.apply_translation([0, 0, z_center])
-            inner.apply_translation([0, 0, z_center])
-            ring = outer.difference(inner)
-            if ring is not None and len(ring.faces) > 0:
-                meshes.append(ring)
-        except Exception:
-            pass
+        z_bottom = self.base_height - self.boolean_overlap
+        meshes.append(self._create_tube_mesh(inner_radius, outer_radius, z_bottom,
+                                             z_bottom + ring_height, self.base_segments))
         
         # Ticks
         tick_height = 0.6
@@ -705,19 +930,24 @@ class DirectionSignGenerator:
         tick_length_med = 3.0
         tick_length_large = 4.0
         tick_radius = self.base_radius * 0.92
-        for deg in range(0, 360, 10):
-            angle = math.radians(-deg)
-            if deg % 90 == 0:
-                tick_length = tick_length_large
-            elif deg % 45 == 0:
-                tick_length = tick_length_med
-            else:
-                tick_length = tick_length_small
-            tick = trimesh.creation.box(extents=[tick_width, tick_length, tick_height])
-            z_center = self.base_height - self.boolean_overlap + tick_height / 2
-            tick.apply_translation([0, tick_radius - tick_length / 2, z_center])
-            tick.apply_transform(trimesh.transformations.rotation_matrix(angle, [0, 0, 1]))
-            meshes.append(tick)
+        degrees = np.arange(0, 360, 10)
+        tick_lengths = np.where(degrees % 90 == 0, tick_length_large,
+                                np.where(degrees % 45 == 0, tick_length_med, tick_length_small))
+        angles = np.radians(-degrees)
+        # Tick centers sit on the +Y axis, then rotate with the tick about the origin
+        center_radius = tick_radius - tick_lengths / 2
+        centers = np.column_stack([
+            -center_radius * np.sin(angles),
+            center_radius * np.cos(angles),
+            np.full(len(degrees), self.base_height - self.boolean_overlap + tick_height / 2),
+        ])
+        extents = np.column_stack([
+            np.full(len(degrees), tick_width),
+            tick_lengths,
+            np.full(len(degrees), tick_height),
+        ])
+        # The ticks are disjoint, so hand them to the union as one mesh
+        meshes.append(self._create_boxes_mesh(extents, centers, angles))
         
         return meshes
     
@@ -748,8 +978,8 @@ class DirectionSignGenerator:
             # Both texts on south side (-Y), centered horizontally
             y_pos = -self.base_radius * self.base_text_radius_factor
             gap = self.base_text_gap
-            lat_width = len(lat_text) * font_size * 0.6
-            lon_width = len(lon_text) * font_size * 0.6
+            lat_width = self._text_width(lat_text, font_size, 0.6)
+            lon_width = self._text_width(lon_text, font_size, 0.6)
             total_width = lat_width + gap + lon_width
             start_x = -total_width / 2
             lat_x = start_x
@@ -757,12 +987,13 @@ class DirectionSignGenerator:
             lat_mesh = self._create_text_mesh_vector(lat_text, font_size, (lat_x, y_pos, base_z), apply_ramp=True)
             lon_mesh = self._create_text_mesh_vector(lon_text, font_size, (lon_x, y_pos, base_z), apply_ramp=True)
 
-            # Rotate both texts another 90° to align with the intended facing direction.
-            self._rotate_mesh_z(lat_mesh, self.base_text_rotation_deg, (0, 0, base_z))
-            self._rotate_mesh_z(lon_mesh, self.base_text_rotation_deg, (0, 0, base_z))
+            # The two texts are disjoint: stack them once, then rotate both another 90°
+            # together to align with the intended facing direction.
+            coords_mesh = self._concatenate_meshes([lat_mesh, lon_mesh])
+            self._rotate_mesh_z(coords_mesh, self.base_text_rotation_deg, (0, 0, base_z))
 
             self._print(f"  Coordinates embossed: {lat_text}, {lon_text}")
-            return [lat_mesh, lon_mesh]
+            return [coords_mesh]
         except Exception as e:
             self._print(f"  Warning: Could not create coordinates text: {e}")
             return []
@@ -787,33 +1018,34 @@ class DirectionSignGenerator:
         
         # Create main cylindrical peg (overlap slightly with the post for union).
         z_base = post_height - self.boolean_overlap
-        peg = trimesh.creation.cylinder(
+        peg = self._create_cylinder(
             radius=peg_radius,
             height=peg_height,
-            sections=32
+            sections=32,
+            transform=trimesh.transformations.translation_matrix([0, 0, z_base + peg_height / 2])
         )
-        peg.apply_translation([0, 0, z_base + peg_height / 2])
         
         # Create alignment key (rectangular protrusion at 0° / +X reference)
-        key_box = trimesh.creation.box(
-            extents=[key_width, key_depth * 2, peg_height]
-        )
         # Position key at south side (-Y) for alignment reference
-        key_box.apply_translation([0, -(peg_radius + key_depth - self.boolean_overlap), z_base + peg_height / 2])
+        key_box = self._create_boxes_mesh(
+            [[key_width, key_depth * 2, peg_height]],
+            [[0, -(peg_radius + key_depth - self.boolean_overlap), z_base + peg_height / 2]],
+            np.zeros(1),
+        )
         
         peg_mesh = self._union_meshes([peg, key_box])
         
         # Add magnet pocket centered on top of peg
         magnet_radius = (self.magnet_diameter / 2) + self.magnet_clearance
         magnet_depth = min(self.magnet_thickness + self.magnet_clearance, peg_height)
-        magnet = trimesh.creation.cylinder(
+        magnet = self._create_cylinder(
             radius=magnet_radius,
             height=magnet_depth,
-            sections=32
+            sections=32,
+            transform=trimesh.transformations.translation_matrix([0, 0, z_base + peg_height - magnet_depth / 2])
         )
-        magnet.apply_translation([0, 0, z_base + peg_height - magnet_depth / 2])
         try:
-            new_mesh = peg_mesh.difference(magnet)
+            new_mesh = self._difference_meshes(peg_mesh, [magnet])
             if new_mesh is not None and len(new_mesh.faces) > 0:
                 peg_mesh = new_mesh
         except Exception:
@@ -842,25 +1074,22 @@ class DirectionSignGenerator:
         key_depth = self.post_radius * 0.1 + self.peg_clearance
         
         # Create main cylindrical socket
-        socket = trimesh.creation.cylinder(
+        socket = self._create_cylinder(
             radius=socket_radius,
             height=socket_depth,
-            sections=32
+            sections=32,
+            transform=trimesh.transformations.translation_matrix([post_x_offset, post_y_offset, socket_depth / 2])
         )
-        socket.apply_translation([post_x_offset, post_y_offset, socket_depth / 2])
         
         # Create alignment key slot (rectangular cutout at 0° / +X reference)
-        key_slot = trimesh.creation.box(
-            extents=[key_width, key_depth * 2, socket_depth]
-        )
         # Position slot at south side (-Y) to match the peg key orientation
-        key_slot.apply_translation([
-            post_x_offset,
-            post_y_offset - (peg_radius + key_depth),
-            socket_depth / 2
-        ])
+        key_slot = self._create_boxes_mesh(
+            [[key_width, key_depth * 2, socket_depth]],
+            [[post_x_offset, post_y_offset - (peg_radius + key_depth), socket_depth / 2]],
+            np.zeros(1),
+        )
         
-        return trimesh.util.concatenate([socket, key_slot])
+        return self._concatenate_meshes([socket, key_slot])
 
     def _create_socket_magnet_cutter(self, post_x_offset: float,
                                      post_y_offset: float) -> trimesh.Trimesh:
@@ -869,16 +1098,16 @@ class DirectionSignGenerator:
         socket_depth = min(8.5, join_max_height)
         magnet_radius = (self.magnet_diameter / 2) + self.magnet_clearance
         magnet_depth = min(self.magnet_thickness + self.magnet_clearance, socket_depth)
-        magnet = trimesh.creation.cylinder(
+        magnet = self._create_cylinder(
             radius=magnet_radius,
             height=magnet_depth,
-            sections=32
+            sections=32,
+            transform=trimesh.transformations.translation_matrix([
+                post_x_offset,
+                post_y_offset,
+                socket_depth + (magnet_depth / 2)
+            ])
         )
-        magnet.apply_translation([
-            post_x_offset,
-            post_y_offset,
-            socket_depth + (magnet_depth / 2)
-        ])
         return magnet
 
     def _get_post_join_pin_offsets(self) -> List[Tuple[float, float]]:
@@ -890,34 +1119,34 @@ class DirectionSignGenerator:
             (-secondary, -primary * 0.6),
         ]
 
-    def _create_post_join_pins(self, post_height: float) -> trimesh.Trimesh:
+    def _create_post_join_pins(self, post_height: float) -> List[trimesh.Trimesh]:
         """Create alignment pins on the top of a post segment for glue-up."""
         z_base = post_height - self.boolean_overlap
         pins = []
         for x, y in self._get_post_join_pin_offsets():
-            pin = trimesh.creation.cylinder(
+            pin = self._create_cylinder(
                 radius=self.join_pin_radius,
                 height=self.join_pin_length,
-                sections=24
+                sections=24,
+                transform=trimesh.transformations.translation_matrix([x, y, z_base + self.join_pin_length / 2])
             )
-            pin.apply_translation([x, y, z_base + self.join_pin_length / 2])
             pins.append(pin)
-        return trimesh.util.concatenate(pins)
+        return pins
 
-    def _create_post_join_pin_holes(self) -> trimesh.Trimesh:
+    def _create_post_join_pin_holes(self) -> List[trimesh.Trimesh]:
         """Create matching holes for post join pins."""
         hole_radius = self.join_pin_radius + self.join_pin_clearance
         hole_depth = self.join_pin_length + self.join_pin_clearance
         holes = []
         for x, y in self._get_post_join_pin_offsets():
-            hole = trimesh.creation.cylinder(
+            hole = self._create_cylinder(
                 radius=hole_radius,
                 height=hole_depth,
-                sections=24
+                sections=24,
+                transform=trimesh.transformations.translation_matrix([x, y, hole_depth / 2])
             )
-            hole.apply_translation([x, y, hole_depth / 2])
             holes.append(hole)
-        return trimesh.util.concatenate(holes)
+        return holes
     
     def _create_box_mesh_at_bearing(self, bearing: float, sign_height: float,
                                     post_x_offset: float, post_y_offset: float) -> trimesh.Trimesh:
@@ -933,53 +1162,61 @@ class DirectionSignGenerator:
         Returns:
             trimesh.Trimesh: Box mesh positioned at the bearing
         """
-        # Box dimensions
-        box_depth = self.flat_depth * 3  # 9mm - extends through post
-        box_width = self.post_radius * 2  # Wide enough to cover post diameter
-        box_height = self.flat_height
-        
-        # Create box centered at origin
-        box = trimesh.creation.box(extents=[box_width, box_depth, box_height])
-        
-        # Position the box at bearing 0 (north for bearings, +Y axis)
-        # Box should be tangent to post surface (not cutting through center)
-        distance_from_center = self.post_radius - self.flat_depth + box_depth / 2
-        
-        # First apply post offset, then position box relative to that post center
-        box.apply_translation([post_x_offset, post_y_offset, 0])
-        
-        # Position box along +Y axis at bearing 0 (relative to post center)
-        box.apply_translation([0, distance_from_center, sign_height])
-        
-        # Rotate around post center (at post_x_offset, post_y_offset) by bearing angle
-        # IMPORTANT: Negate bearing because cylinder is viewed from bottom looking up
-        angle_rad = math.radians(-bearing)
-        # Create rotation matrix around the post center, not origin
-        rotation_matrix = trimesh.transformations.rotation_matrix(
-            angle_rad, [0, 0, 1], [post_x_offset, post_y_offset, 0]
-        )
-        box.apply_transform(rotation_matrix)
-        
-        return box
+        def build() -> trimesh.Trimesh:
+            # Box dimensions
+            box_depth = self.flat_depth * 3  # 9mm - extends through post
+            box_width = self.post_radius * 2  # Wide enough to cover post diameter
+            box_height = self.flat_height
+            
+            # Position the box at bearing 0 (north for bearings, +Y axis)
+            # Box should be tangent to post surface (not cutting through center)
+            distance_from_center = self.post_radius - self.flat_depth + box_depth / 2
+            
+            # Rotate around post center (at post_x_offset, post_y_offset) by bearing angle
+            # IMPORTANT: Negate bearing because cylinder is viewed from bottom looking up
+            angle_rad = math.radians(-bearing)
+            # Box center after rotating (0, distance_from_center) about the post center
+            center = [
+                post_x_offset - distance_from_center * math.sin(angle_rad),
+                post_y_offset + distance_from_center * math.cos(angle_rad),
+                sign_height,
+            ]
+            
+            # Emit the 8 placed corners from the unit box template in one broadcast
+            return self._create_boxes_mesh([[box_width, box_depth, box_height]], [center],
+                                           np.array([angle_rad]))
+        return self._placed_mesh("flat_box", bearing, sign_height, post_x_offset, post_y_offset, build)
     
-    def _create_text_mesh_vector(self, text: str, font_size: float, position: Tuple[float, float, float],
-                                 apply_ramp: bool = False) -> trimesh.Trimesh:
+    def _create_boxes_mesh(self, extents: np.ndarray, centers: np.ndarray,
+                           angles: np.ndarray) -> trimesh.Trimesh:
         """
-        Create high-quality vector-based 3D text mesh using FreeType.
-        
-        Args:
-            text: Text to render (will be converted to uppercase)
-            font_size: Font size in mm
-            position: (x, y, z) position for the text
-            
-        Returns:
-            trimesh.Trimesh: 3D text mesh
+        Build many boxes as one mesh from the unit box template.
+        Each box is rotated by its angle (radians) about Z around its own center.
         """
-        if not FREETYPE_AVAILABLE:
-            raise ImportError("freetype-py and shapely required for vector text")
-        
-        # Convert to uppercase to avoid descenders
-        text = text.upper()
+        extents = np.asarray(extents, dtype=np.float64)
+        centers = np.asarray(centers, dtype=np.float64)
+        cos_a = np.cos(angles)[:, None]
+        sin_a = np.sin(angles)[:, None]
+        local = self._BOX_CORNERS[None, :, :] * (0.5 * extents)[:, None, :]
+        vertices = np.empty_like(local)
+        vertices[..., 0] = local[..., 0] * cos_a - local[..., 1] * sin_a
+        vertices[..., 1] = local[..., 0] * sin_a + local[..., 1] * cos_a
+        vertices[..., 2] = local[..., 2]
+        vertices += centers[:, None, :]
+        count = len(extents)
+        faces = self._BOX_FACES[None, :, :] + (8 * np.arange(count))[:, None, None]
+        return trimesh.Trimesh(vertices=vertices.reshape(-1, 3), faces=faces.reshape(-1, 3),
+                               process=False)
+
+    def _get_font_face(self):
+        """Load the text font on first use and reuse it for every later call."""
+        if self._face is not None:
+            return self._face
+        if self._font_missing:
+            raise RuntimeError("Could not load any system font")
+        if self._font_source is not None:
+            self._face = freetype.Face(*self._font_source)
+            return self._face
         
         # Font paths to try (prefer bold variants)
         font_paths = [
@@ -993,9 +1230,11 @@ class DirectionSignGenerator:
         ]
         
         face = None
+        source = None
         for font_path in font_paths:
             try:
                 face = freetype.Face(font_path)
+                source = (font_path, 0)
                 # For TTC files (font collections), try to select a bold face
                 if font_path.endswith('.ttc'):
                     # Try to find a bold face in the collection
@@ -1006,6 +1245,7 @@ class DirectionSignGenerator:
                             style_name = test_face.style_name.decode('utf-8').lower() if hasattr(test_face.style_name, 'decode') else str(test_face.style_name).lower()
                             if 'bold' in face_name or 'bold' in style_name:
                                 face = test_face
+                                source = (font_path, face_index)
                                 break
                         except:
                             continue
@@ -1014,114 +1254,383 @@ class DirectionSignGenerator:
                 continue
         
         if face is None:
+            # Remember the failure so later text does not probe every path again
+            self._font_missing = True
             raise RuntimeError("Could not load any system font")
         
-        # Set font size (FreeType uses 1/64th of a point)
-        # Minimum font size to avoid division by zero errors
+        self._face = face
+        self._font_source = source
+        return face
+    
+    def _get_advance_table(self) -> np.ndarray:
+        """
+        Return per-codepoint advance widths (in EMs) for printable ASCII, loaded once.
+        An empty array means no font is available and callers should fall back to estimates.
+        """
+        if self._advance_table is not None:
+            return self._advance_table
+        table = np.zeros(0)
+        if FREETYPE_AVAILABLE:
+            try:
+                face = self._get_font_face()
+                table = np.zeros(128)
+                for code in range(32, 127):
+                    face.load_char(chr(code), freetype.FT_LOAD_NO_SCALE | freetype.FT_LOAD_NO_BITMAP)
+                    table[code] = face.glyph.advance.x / face.units_per_EM
+            except RuntimeError:
+                table = np.zeros(0)
+        self._advance_table = table
+        return table
+    
+    def _text_width(self, text: str, font_size: float, fallback_factor: float) -> float:
+        """
+        Width of uppercased text in mm from the font's advance widths.
+        Characters outside printable ASCII (or all of them, without a font) use
+        fallback_factor * font_size.
+        """
+        text = text.upper()
+        if not text:
+            return 0.0
+        table = self._get_advance_table()
+        if len(table) == 0:
+            return len(text) * font_size * fallback_factor
+        codes = np.fromiter((ord(c) for c in text), dtype=np.int64, count=len(text))
+        known = (codes >= 32) & (codes < 127)
+        em_width = table[codes[known]].sum() + (len(codes) - known.sum()) * fallback_factor
+        return float(em_width) * font_size
+    
+    def _contour_signed_areas(self, points: np.ndarray, starts: np.ndarray,
+                              ends: np.ndarray) -> np.ndarray:
+        """Shoelace signed area of every closed contour in an outline, computed in one pass."""
+        # Each point pairs with the next one in its contour, wrapping back to the start
+        following = np.arange(1, len(points) + 1)
+        following[ends] = starts
+        cross = points[:, 0] * points[following, 1] - points[following, 0] * points[:, 1]
+        return 0.5 * np.add.reduceat(cross, starts)
+    
+    def _glyph_polygons(self, face, char: str) -> Tuple[List["Polygon"], float]:
+        """
+        Return the unscaled outline polygons of a character (pen at X=0) and its advance,
+        both in font units. Results are cached per character and shared by every font size.
+        """
+        cached = self._glyph_cache.get(char)
+        if cached is not None:
+            return cached
+        
+        face.load_char(char, freetype.FT_LOAD_NO_SCALE | freetype.FT_LOAD_NO_BITMAP)
+        glyph = face.glyph
+        outline = glyph.outline
+        glyph_polygons = []
+        
+        if len(outline.points) > 0:
+            # Outline points in font units
+            points = np.asarray(outline.points, dtype=np.float64)
+            
+            # Split contours into shells and holes by winding direction; the
+            # largest contour is always a shell, so anything wound the other
+            # way is a hole (this holds for both TrueType and CFF outlines).
+            ends = np.asarray(outline.contours, dtype=np.int64)
+            starts = np.concatenate([[0], ends[:-1] + 1])
+            signed_areas = self._contour_signed_areas(points, starts, ends)
+            contours = []
+            for start, end, signed_area in zip(starts, ends, signed_areas):
+                # Need at least 3 points for a valid polygon
+                if end - start < 2:
+                    continue
+                if abs(signed_area) > 1e-9:  # Filter out degenerate contours
+                    contours.append((points[start:end+1], float(signed_area)))
+            
+            if contours:
+                contours.sort(key=lambda c: abs(c[1]), reverse=True)
+                shell_ccw = contours[0][1] > 0
+                shells = [pts for pts, area in contours if (area > 0) == shell_ccw]
+                shell_polygons = [Polygon(pts) for pts in shells]
+                shell_holes = [[] for _ in shells]
+                for pts, area in contours:
+                    if (area > 0) == shell_ccw:
+                        continue
+                    # Attach the hole to the smallest shell that contains it
+                    probe = Point(pts[0])
+                    for index in range(len(shells) - 1, -1, -1):
+                        if shell_polygons[index].contains(probe):
+                            shell_holes[index].append(pts)
+                            break
+                
+                for shell, shell_polygon, holes in zip(shells, shell_polygons, shell_holes):
+                    poly = Polygon(shell, holes) if holes else shell_polygon
+                    if poly.is_valid:
+                        glyph_polygons.append(poly)
+                    elif shell_polygon.is_valid:
+                        glyph_polygons.append(shell_polygon)
+        
+        cached = (glyph_polygons, float(glyph.advance.x))
+        self._glyph_cache[char] = cached
+        return cached
+    
+    def _glyph_triangulation(self, face, char: str) -> Tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+        """
+        Return a character's cap triangulation (vertices, counter-clockwise faces),
+        its boundary edges and its advance, in font units. Uniform scaling and
+        translation keep all of these valid, so each character is triangulated and
+        outlined once for every size and position.
+        """
+        cached = self._glyph_triangulation_cache.get(char)
+        if cached is not None:
+            return cached
+        
+        glyph_polygons, advance = self._glyph_polygons(face, char)
+        vertex_blocks = []
+        face_blocks = []
+        vertex_offset = 0
+        for p in glyph_polygons:
+            if p.is_empty:
+                continue
+            try:
+                vertices_2d, faces_2d = trimesh.creation.triangulate_polygon(p)
+            except Exception as e:
+                self._print(f"      Warning: Could not triangulate polygon (area={p.area:.2f}): {e}")
+                continue
+            if len(faces_2d) == 0:
+                continue
+            vertices_2d = np.asarray(vertices_2d, dtype=np.float64)
+            faces_2d = np.asarray(faces_2d, dtype=np.int64)
+            # Wind every triangle counter-clockwise so a single extrusion
+            # orients all of them the same way.
+            edge_a = vertices_2d[faces_2d[:, 1]] - vertices_2d[faces_2d[:, 0]]
+            edge_b = vertices_2d[faces_2d[:, 2]] - vertices_2d[faces_2d[:, 0]]
+            clockwise = edge_a[:, 0] * edge_b[:, 1] - edge_a[:, 1] * edge_b[:, 0] < 0
+            faces_2d[clockwise] = faces_2d[clockwise][:, ::-1]
+            vertex_blocks.append(vertices_2d)
+            face_blocks.append(faces_2d + vertex_offset)
+            vertex_offset += len(vertices_2d)
+        
+        if face_blocks:
+            faces_2d = np.vstack(face_blocks)
+            cached = (np.vstack(vertex_blocks), faces_2d, self._boundary_edges(faces_2d), advance)
+        else:
+            cached = (np.zeros((0, 2)), np.zeros((0, 3), dtype=np.int64),
+                      np.zeros((0, 2), dtype=np.int64), advance)
+        self._glyph_triangulation_cache[char] = cached
+        return cached
+    
+    def _boundary_edges(self, faces_2d: np.ndarray) -> np.ndarray:
+        """
+        Directed edges used by exactly one triangle. Edges are matched by vertex index
+        rather than position, so polygons that touch (e.g. adjacent glyphs) stay separate.
+        """
+        edges = np.vstack([faces_2d[:, [0, 1]], faces_2d[:, [1, 2]], faces_2d[:, [2, 0]]])
+        _, first, occurrences = np.unique(
+            np.sort(edges, axis=1), axis=0, return_index=True, return_counts=True
+        )
+        return edges[first[occurrences == 1]]
+    
+    def _extrude_triangulation(self, vertices_2d: np.ndarray, faces_2d: np.ndarray,
+                               height: float, boundary: np.ndarray) -> trimesh.Trimesh:
+        """
+        Extrude stacked counter-clockwise 2D triangulations along +Z in one pass,
+        with side walls along the given boundary edges.
+        """
+        count = len(vertices_2d)
+        start, end = boundary[:, 0], boundary[:, 1]
+        walls = np.column_stack([
+            start, end, end + count,
+            start, end + count, start + count,
+        ]).reshape(-1, 3)
+        vertices = np.vstack([
+            np.column_stack([vertices_2d, np.zeros(count)]),
+            np.column_stack([vertices_2d, np.full(count, height)]),
+        ])
+        faces = np.vstack([faces_2d[:, ::-1], faces_2d + count, walls])
+        return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+    
+    def _create_text_mesh_vector(self, text: str, font_size: float, position: Tuple[float, float, float],
+                                 apply_ramp: bool = False) -> trimesh.Trimesh:
+        """
+        Create high-quality vector-based 3D text mesh using FreeType.
+        
+        Args:
+            text: Text to render (will be converted to uppercase)
+            font_size: Font size in mm
+            position: (x, y, z) position for the text
+            
+        Returns:
+            trimesh.Trimesh: 3D text mesh
+        """
+        if not FREETYPE_AVAILABLE:
+            raise ImportError("freetype-py and shapely required for vector text")
+        
+        # Convert to uppercase to avoid descenders
+        text = text.upper()
+        
+        face = self._get_font_face()
+        
+        # Minimum font size keeps glyph features printable
         if font_size < 3.0:
             raise ValueError(f"Font size {font_size} too small (minimum 3.0mm)")
         
-        face.set_char_size(int(font_size * 64))
+        # Reuse the mesh built at the origin for an identical earlier request
+        cache_key = (text, round(font_size, 3), apply_ramp)
+        template = self._text_mesh_cache.get(cache_key)
+        if template is None:
+            template = self._build_text_mesh(face, text, font_size, apply_ramp)
+            self._text_mesh_cache[cache_key] = template
         
-        # Collect all character polygons
-        all_polygons = []
+        # Position the text
+        return trimesh.Trimesh(
+            vertices=template.vertices + np.asarray(position, dtype=np.float64),
+            faces=template.faces.copy(),
+            process=False
+        )
+    
+    def _build_text_mesh(self, face, text: str, font_size: float,
+                         apply_ramp: bool) -> trimesh.Trimesh:
+        """Build the extruded mesh for already-uppercased text with its origin at (0, 0, 0)."""
+        # Glyphs are triangulated once in font units; one EM maps to font_size mm
+        scale = font_size / face.units_per_EM
+        
+        # Scale and place each character's cached cap triangulation
+        vertex_blocks = []
+        face_blocks = []
+        boundary_blocks = []
+        vertex_offset = 0
         pen_x = 0
         
         for char in text:
-            face.load_char(char, freetype.FT_LOAD_NO_BITMAP)
-            glyph = face.glyph
-            outline = glyph.outline
-            
-            if len(outline.points) > 0:
-                # Convert outline points
-                points = [(pt[0] / 64.0 + pen_x, pt[1] / 64.0) for pt in outline.points]
-                
-                # Process contours - need to handle holes properly
-                start = 0
-                char_polygons = []
-                for end in outline.contours:
-                    contour_points = points[start:end+1]
-                    # Need at least 3 points for a valid polygon
-                    if len(contour_points) >= 3:
-                        try:
-                            # Close the contour if needed
-                            if contour_points[0] != contour_points[-1]:
-                                contour_points.append(contour_points[0])
-                            
-                            poly = Polygon(contour_points)
-                            if poly.is_valid and poly.area > 1e-9:  # Filter out degenerate polygons
-                                char_polygons.append(poly)
-                        except Exception as e:
-                            pass
-                    start = end + 1
-                
-                # Separate exterior and holes based on area/orientation
-                if char_polygons:
-                    # The largest polygon is typically the exterior
-                    char_polygons.sort(key=lambda p: abs(p.area), reverse=True)
-                    if char_polygons:
-                        exterior = char_polygons[0]
-                        
-                        # For simple characters (like comma, period), just use the exterior
-                        # For complex characters, identify and subtract holes
-                        if len(char_polygons) > 1:
-                            holes = [p for p in char_polygons[1:] if p.within(exterior)]
-                            
-                            # Create polygon with holes
-                            if holes:
-                                try:
-                                    # Subtract holes from exterior
-                                    result = exterior
-                                    for hole in holes:
-                                        result = result.difference(hole)
-                                    all_polygons.append(result)
-                                except:
-                                    all_polygons.append(exterior)
-                            else:
-                                all_polygons.append(exterior)
-                        else:
-                            # Single contour - just add it
-                            all_polygons.append(exterior)
+            vertices_2d, faces_2d, boundary, advance = self._glyph_triangulation(face, char)
+            if len(faces_2d):
+                vertex_blocks.append(vertices_2d * scale + [pen_x, 0.0])
+                face_blocks.append(faces_2d + vertex_offset)
+                boundary_blocks.append(boundary + vertex_offset)
+                vertex_offset += len(vertices_2d)
             
             # Advance pen position
-            pen_x += glyph.advance.x / 64.0
-        
-        if not all_polygons:
-            raise ValueError(f"No valid geometry generated for text: {text}")
-        
-        # Convert to trimesh
-        meshes = []
-        for poly in all_polygons:
-            # Handle both Polygon and MultiPolygon
-            if isinstance(poly, MultiPolygon):
-                poly_list = list(poly.geoms)
-            else:
-                poly_list = [poly]
-            
-            for p in poly_list:
-                if p.is_valid and not p.is_empty and p.area > 1e-6:  # Skip tiny polygons
-                    try:
-                        # Extrude the 2D polygon to 3D
-                        text_mesh = trimesh.creation.extrude_polygon(p, height=self.text_height)
-                        if text_mesh is not None and len(text_mesh.vertices) > 0:
-                            meshes.append(text_mesh)
-                    except Exception as e:
-                        self._print(f"      Warning: Could not extrude polygon (area={p.area:.2f}): {e}")
-                        pass
+            pen_x += advance * scale
         
-        if not meshes:
+        if not face_blocks:
             raise ValueError(f"Failed to create 3D mesh for text: {text}")
         
-        # Combine all character meshes
-        result = trimesh.util.concatenate(meshes)
+        result = self._extrude_triangulation(
+            np.vstack(vertex_blocks), np.vstack(face_blocks), self.text_height,
+            np.vstack(boundary_blocks)
+        )
         
-        # Position the text
-        result.apply_translation([position[0], position[1], position[2]])
         if apply_ramp:
-            self._apply_text_ramp(result, position[2])
+            self._apply_text_ramp(result, 0.0)
         
         return result
     
+    def _build_canonical_sign(self, sign_length: float, sign_height: float,
+                              point_length: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Build the sign plate in canonical (right-pointing) space.
+        Square end at X=0; pointed end at X=sign_length when point_length > 0,
+        otherwise a plain box. Returns (vertices, faces).
+        """
+        if point_length <= 0:
+            half_extents = 0.5 * np.array([sign_length, sign_height, self.sign_thickness])
+            return self._BOX_CORNERS * half_extents + half_extents, self._BOX_FACES.copy()
+
+        body_length = sign_length - point_length
+        tip_y = sign_height / 2
+        vertices = np.empty((10, 3))
+        vertices[0] = [0, 0, 0]
+        vertices[1] = [0, sign_height, 0]
+        vertices[2] = [0, sign_height, self.sign_thickness]
+        vertices[3] = [0, 0, self.sign_thickness]
+        vertices[4] = [body_length, 0, 0]
+        vertices[5] = [body_length, sign_height, 0]
+        vertices[6] = [body_length, sign_height, self.sign_thickness]
+        vertices[7] = [body_length, 0, self.sign_thickness]
+        vertices[8] = [sign_length, tip_y, 0]
+        vertices[9] = [sign_length, tip_y, self.sign_thickness]
+        return vertices, self._ARROW_SIGN_FACES.copy()
+
+    def _build_holed_sign(self, sign_length: float, sign_height: float, point_length: float,
+                          hole_centers: np.ndarray, hole_radius: float, hole_depth: float,
+                          sections: int = 24) -> Tuple[np.ndarray, np.ndarray] | None:
+        """
+        Build the canonical sign plate with blind pin holes in its backside directly,
+        rather than cutting cylinders out of the plate. Returns (vertices, faces), or
+        None when the holes go through the plate or do not fit inside its outline,
+        or when shapely is unavailable; the caller then cuts the holes instead.
+        """
+        if not FREETYPE_AVAILABLE:
+            return None
+        if point_length > 0:
+            body_length = sign_length - point_length
+            outline = np.array([[0, 0], [body_length, 0], [sign_length, sign_height / 2],
+                                [body_length, sign_height], [0, sign_height]], dtype=np.float64)
+        else:
+            outline = np.array([[0, 0], [sign_length, 0], [sign_length, sign_height],
+                                [0, sign_height]], dtype=np.float64)
+        rings = hole_centers[:, None, :] + hole_radius * self._unit_circle(sections)[None, :, :]
+        back = Polygon(outline, list(rings))
+        if hole_depth >= self.sign_thickness or not back.is_valid:
+            return None
+
+        # Planar points: the counter-clockwise outline, then each counter-clockwise hole ring
+        points = np.vstack([outline, rings.reshape(-1, 2)])
+        outline_count = len(outline)
+        count = len(points)
+        try:
+            vertices_2d, faces_2d = trimesh.creation.triangulate_polygon(back, force_vertices=True)
+        except (ValueError, AssertionError):
+            return None
+        # Map the triangulator's vertices back onto the planar points by position;
+        # any vertex it added stays -1 and sends the sign to the boolean cut instead.
+        _, inverse = np.unique(np.vstack([points, vertices_2d]), axis=0, return_inverse=True)
+        inverse = inverse.reshape(-1)
+        lookup = np.full(inverse.max() + 1, -1, dtype=np.int64)
+        lookup[inverse[:count]] = np.arange(count)
+        back_faces = lookup[inverse[count:]][np.asarray(faces_2d, dtype=np.int64)]
+        # The walls need every outline and ring point on the backside as well
+        if (len(back_faces) == 0 or back_faces.min() < 0
+                or len(np.unique(back_faces)) != count):
+            return None
+        edge_a = points[back_faces[:, 1]] - points[back_faces[:, 0]]
+        edge_b = points[back_faces[:, 2]] - points[back_faces[:, 0]]
+        clockwise = edge_a[:, 0] * edge_b[:, 1] - edge_a[:, 1] * edge_b[:, 0] < 0
+        back_faces[clockwise] = back_faces[clockwise][:, ::-1]
+
+        # Vertices: every planar point on the backside, the same points again with the
+        # outline on the front and the hole rings at the hole floor, then hole centers.
+        upper_z = np.full(count, hole_depth)
+        upper_z[:outline_count] = self.sign_thickness
+        vertices = np.vstack([
+            np.column_stack([points, np.zeros(count)]),
+            np.column_stack([points, upper_z]),
+            np.column_stack([hole_centers, np.full(len(hole_centers), hole_depth)]),
+        ])
+
+        # Outer walls face out; the front is a fan over the convex outline
+        start = np.arange(outline_count)
+        end = np.roll(start, -1)
+        outer_walls = np.column_stack([
+            start, end, end + count,
+            start, end + count, start + count,
+        ]).reshape(-1, 3)
+        front = np.column_stack([
+            np.zeros(outline_count - 2, dtype=np.int64),
+            np.arange(1, outline_count - 1),
+            np.arange(2, outline_count),
+        ]) + count
+
+        # Hole walls face the hole axis; each floor is a fan facing the backside
+        ring_start = (outline_count + np.arange(len(hole_centers))[:, None] * sections
+                      + np.arange(sections)[None, :])
+        ring_end = (outline_count + np.arange(len(hole_centers))[:, None] * sections
+                    + (np.arange(sections)[None, :] + 1) % sections)
+        ring_start, ring_end = ring_start.reshape(-1), ring_end.reshape(-1)
+        hole_walls = np.column_stack([
+            ring_end, ring_start, ring_start + count,
+            ring_end, ring_start + count, ring_end + count,
+        ]).reshape(-1, 3)
+        floor_centers = 2 * count + np.repeat(np.arange(len(hole_centers)), sections)
+        floors = np.column_stack([floor_centers, ring_end + count, ring_start + count])
+
+        faces = np.vstack([back_faces[:, ::-1], outer_walls, front, hole_walls, floors])
+        return vertices, faces
+
     def generate_sign(self, text: str, distance: str, output_path: str, bearing: float = 0.0,
                       segment_id: int | None = None, arrowed: bool = True):
         """
@@ -1140,6 +1649,18 @@ class DirectionSignGenerator:
         point_left = bearing > 180.0 if arrowed else False
         direction_note = " (pointing left)" if point_left else " (pointing right)"
         self._print(f"Generating sign for '{text}'{direction_note}...")
+
+        # Reuse an identical sign from an earlier run when caching is enabled
+        cache_path = None
+        if self.sign_cache_dir:
+            cache_path = self._sign_cache_path(text, distance, arrowed, point_left, segment_id)
+            if os.path.exists(cache_path):
+                shutil.copyfile(cache_path, output_path)
+                with open(output_path, "r+b") as handle:
+                    handle.write(self._stl_header(output_path))
+                self._print(f"  Reused cached sign: {cache_path}")
+                self._print(f"  Saved: {output_path}")
+                return
         
         # Calculate sign dimensions
         sign_height = self.flat_height - (2 * self.sign_clearance)
@@ -1157,19 +1678,16 @@ class DirectionSignGenerator:
         distance_font_size = max(min_distance_font_size, distance_font_size)
         units_font_size = max(min_distance_font_size, distance_font_size * 0.85)
         
-        # Calculate text width (layout estimate)
-        # Uppercase text is wider; add margin to reduce overlap risk.
+        # Calculate text width from font advances (heuristic factors are the fallback)
+        # Add margin to reduce overlap risk. Widths are linear in font size, so each
+        # string is measured once at 1mm and scaled from there.
         name_width_factor = 0.65
         distance_width_factor = 0.6
         distance_width_margin = 2.0
         main_text_len = len(text.upper())
-        main_text_width = main_text_len * font_size * name_width_factor
-        def compute_distance_width() -> float:
-            value_width = len(distance_value) * distance_font_size * distance_width_factor
-            units_width = len(distance_units) * units_font_size * distance_width_factor
-            return max(value_width, units_width) + distance_width_margin
-
-        distance_width = compute_distance_width() if has_distance else 0.0
+        name_em = self._text_width(text, 1.0, name_width_factor)
+        value_em = self._text_width(distance_value, 1.0, distance_width_factor)
+        units_em = self._text_width(distance_units, 1.0, distance_width_factor)
         
         # Minimum readable size
         min_main_font = 12.0  # Main text must be at least 12mm
@@ -1182,55 +1700,70 @@ class DirectionSignGenerator:
         base_text_gap = 16.0
         text_gap = max(10.0, base_text_gap - max(0, main_text_len - 6) * 1.2)
         effective_gap = text_gap if has_distance else 0.0
+        fixed_length = attach_pad + effective_gap + tip_padding
+        
+        def distance_block_width(dist_font):
+            """Width of the stacked distance value/units for scalar or array font sizes."""
+            if not has_distance:
+                return 0.0 * dist_font
+            units_font = np.maximum(min_distance_font_size, dist_font * 0.85)
+            return np.maximum(dist_font * value_em, units_font * units_em) + distance_width_margin
         
         # Try to fit text at max sign length
         sign_length = self.max_sign_length
         body_length = sign_length - point_length
-
-        def compute_required_body_length() -> float:
-            return attach_pad + main_text_width + effective_gap + distance_width + tip_padding
-
-        required_body_length = compute_required_body_length()
-        self._print(
-            f"  Layout widths: name={main_text_width:.1f}mm, "
-            f"distance={distance_width:.1f}mm, "
-            f"required_body={required_body_length:.1f}mm, "
-            f"body_length={body_length:.1f}mm"
-        )
-        if required_body_length < body_length:
-            optimal_length = required_body_length + point_length
-            if optimal_length < sign_length:
-                sign_length = max(60.0, optimal_length)
-                body_length = sign_length - point_length
-                self._print(f"  Note: Reduced sign length to {sign_length:.1f}mm to fit text")
-        elif required_body_length > body_length:
-            # Reduce font size(s) until both texts fit within max length
-            while required_body_length > body_length and (font_size > min_main_font or distance_font_size > min_distance_font_size):
-                if font_size > min_main_font:
-                    font_size = max(min_main_font, font_size - 0.5)
-                else:
-                    distance_font_size = max(min_distance_font_size, distance_font_size - 0.5)
-                    units_font_size = max(min_distance_font_size, distance_font_size * 0.85)
-                distance_font_size = min(distance_font_size, font_size * 0.65)
-                units_font_size = max(min_distance_font_size, distance_font_size * 0.85)
-                main_text_width = main_text_len * font_size * name_width_factor
-                distance_width = compute_distance_width() if has_distance else 0.0
-                required_body_length = compute_required_body_length()
+        required_body_length = fixed_length + font_size * name_em + distance_block_width(distance_font_size)
+        if self.debug:
             self._print(
-                f"  Layout after sizing: name={main_text_width:.1f}mm, "
-                f"distance={distance_width:.1f}mm, "
+                f"  Layout widths: name={font_size * name_em:.1f}mm, "
+                f"distance={distance_block_width(distance_font_size):.1f}mm, "
                 f"required_body={required_body_length:.1f}mm, "
-                f"body_length={body_length:.1f}mm, "
-                f"font={font_size:.1f}mm, dist_font={distance_font_size:.1f}mm"
+                f"body_length={body_length:.1f}mm"
             )
+        if required_body_length > body_length:
+            # Evaluate the whole 0.5mm shrink schedule at once and take the first step
+            # that fits: the name font drops to min_main_font first, then the distance
+            # font drops to its minimum, always capped at 65% of the name font.
+            name_steps = 0
+            if font_size > min_main_font:
+                name_steps = int(math.ceil(round((font_size - min_main_font) / 0.5, 9)))
+            name_fonts = np.maximum(min_main_font, font_size - 0.5 * np.arange(1, name_steps + 1))
+            dist_fonts = np.minimum(distance_font_size, name_fonts * 0.65)
+            last_name_font = name_fonts[-1] if name_steps else font_size
+            last_dist_font = dist_fonts[-1] if name_steps else distance_font_size
+            dist_steps = 0
+            if last_dist_font > min_distance_font_size:
+                dist_steps = int(math.ceil(round((last_dist_font - min_distance_font_size) / 0.5, 9)))
+            tail_dist_fonts = np.minimum(
+                np.maximum(min_distance_font_size, last_dist_font - 0.5 * np.arange(1, dist_steps + 1)),
+                last_name_font * 0.65,
+            )
+            name_fonts = np.concatenate([name_fonts, np.full(dist_steps, last_name_font)])
+            dist_fonts = np.concatenate([dist_fonts, tail_dist_fonts])
+            if len(name_fonts):
+                required = fixed_length + name_fonts * name_em + distance_block_width(dist_fonts)
+                fits = required <= body_length
+                step = int(np.argmax(fits)) if fits.any() else len(required) - 1
+                font_size = float(name_fonts[step])
+                distance_font_size = float(dist_fonts[step])
+                required_body_length = float(required[step])
+            if self.debug:
+                self._print(
+                    f"  Layout after sizing: name={font_size * name_em:.1f}mm, "
+                    f"distance={distance_block_width(distance_font_size):.1f}mm, "
+                    f"required_body={required_body_length:.1f}mm, "
+                    f"body_length={body_length:.1f}mm, "
+                    f"font={font_size:.1f}mm, dist_font={distance_font_size:.1f}mm"
+                )
             if required_body_length > body_length:
                 self._print(f"  Warning: Text may overlap; name text at minimum size")
         
-        # Final calculations
+        # Final sizes and widths; the distance text never exceeds 65% of the name text
         distance_font_size = min(distance_font_size, font_size * 0.65)
         units_font_size = max(min_distance_font_size, distance_font_size * 0.85)
-        distance_width = compute_distance_width() if has_distance else 0.0
-        main_text_width = main_text_len * font_size * name_width_factor
+        main_text_width = font_size * name_em
+        distance_width = float(distance_block_width(distance_font_size))
+        required_body_length = fixed_length + main_text_width + distance_width
         
         # Clamp font size
         font_size = max(self.min_font_size, min(font_size, self.max_font_size))
@@ -1238,94 +1771,59 @@ class DirectionSignGenerator:
         # Minimum practical length
         if sign_length < 60:
             sign_length = 60
+            body_length = sign_length - point_length
         
-        # Final body_length calculation
-        body_length = sign_length - point_length
-        
-        # After font adjustments, shrink again if there is extra space.
-        required_body_length = compute_required_body_length()
+        # Shrink the sign to the text when there is spare length
         if required_body_length < body_length:
             sign_length = max(60.0, required_body_length + point_length)
             body_length = sign_length - point_length
             self._print(f"  Note: Reduced sign length to {sign_length:.1f}mm to fit text")
         
-        self._print(f"  Sign dimensions: {sign_length:.1f}mm long × {sign_height:.1f}mm tall × {self.sign_thickness:.1f}mm thick")
-        self._print(f"  Font size: {font_size:.1f}mm")
-        self._print(f"  Distance font: {distance_font_size:.1f}mm")
+        if self.debug:
+            self._print(f"  Sign dimensions: {sign_length:.1f}mm long × {sign_height:.1f}mm tall × {self.sign_thickness:.1f}mm thick")
+            self._print(f"  Font size: {font_size:.1f}mm")
+            self._print(f"  Distance font: {distance_font_size:.1f}mm")
         
         # Create the basic sign shape (pointed on one end, square on the other)
-        # The pointed end will aim toward the location
-        
-        vertices = []
-        
-        if arrowed:
-            # Build right-pointing geometry (square end at X=0, pointed end at X=sign_length)
-            vertices.append([0, 0, 0])
-            vertices.append([0, sign_height, 0])
-            vertices.append([0, sign_height, self.sign_thickness])
-            vertices.append([0, 0, self.sign_thickness])
-            
-            body_length = sign_length - point_length
-            vertices.append([body_length, 0, 0])
-            vertices.append([body_length, sign_height, 0])
-            vertices.append([body_length, sign_height, self.sign_thickness])
-            vertices.append([body_length, 0, self.sign_thickness])
-            
-            tip_y = sign_height / 2
-            vertices.append([sign_length, tip_y, 0])
-            vertices.append([sign_length, tip_y, self.sign_thickness])
-            
-            # Define faces for right-pointing geometry
-            faces = []
-            faces.extend([[0, 2, 1], [0, 3, 2]])
-            faces.extend([[0, 1, 5], [0, 5, 4]])
-            faces.extend([[3, 6, 2], [3, 7, 6]])
-            faces.extend([[0, 4, 7], [0, 7, 3]])
-            faces.extend([[1, 2, 6], [1, 6, 5]])
-            faces.append([4, 5, 8])
-            faces.append([7, 9, 6])
-            faces.extend([[4, 8, 9], [4, 9, 7]])
-            faces.extend([[5, 6, 9], [5, 9, 8]])
-            
-            if point_left:
-                vertices = [[sign_length - v[0], v[1], v[2]] for v in vertices]
-                faces = [[f[2], f[1], f[0]] for f in faces]
+        # The pointed end will aim toward the location; left-pointing signs are
+        # the canonical right-pointing plate mirrored across X = sign_length / 2.
+        # The pin holes sit on that mirror line, so they are built into the plate.
+        hole_layout = self._sign_hole_layout(sign_length, sign_height, segment_id)
+        holed = None
+        if hole_layout is not None:
+            hole_centers, hole_radius, hole_depth = hole_layout
+            holed = self._build_holed_sign(sign_length, sign_height, point_length,
+                                           hole_centers, hole_radius, hole_depth)
+        if holed is not None:
+            vertices, faces = holed
         else:
-            sign_base = trimesh.creation.box(
-                extents=[sign_length, sign_height, self.sign_thickness]
-            )
-            sign_base.apply_translation([
-                sign_length / 2,
-                sign_height / 2,
-                self.sign_thickness / 2
-            ])
-            vertices = sign_base.vertices.tolist()
-            faces = sign_base.faces.tolist()
-        
-        # Create base sign mesh using trimesh for easier text operations
-        vertices_array = np.array(vertices)
-        faces_array = np.array(faces)
-        
-        sign_base = trimesh.Trimesh(vertices=vertices_array, faces=faces_array)
-        
-        # Add indexing hole on the backside (for post pin alignment).
-        try:
-            if segment_id is not None and segment_id <= 15:
-                hole_meshes = self._create_id_holes_for_sign(
-                    sign_length, sign_height, point_left, segment_id
+            vertices, faces = self._build_canonical_sign(sign_length, sign_height, point_length)
+        if point_left:
+            vertices[:, 0] = sign_length - vertices[:, 0]
+            faces = np.ascontiguousarray(faces[:, ::-1])
+
+        def place_x(x: float, width: float) -> float:
+            """Map a canonical block start to the sign's actual orientation."""
+            return sign_length - x - width if point_left else x
+
+        # Create base sign mesh using trimesh for easier text operations.
+        # trimesh keeps references to these arrays (no copy), so they must be owned here.
+        sign_base = trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+        
+        # Through (or overlapping) pin holes cannot be stamped; cut them instead.
+        if hole_layout is not None and holed is None:
+            hole_meshes = [
+                self._create_cylinder(
+                    radius=hole_radius,
+                    height=hole_depth,
+                    sections=24,
+                    transform=trimesh.transformations.translation_matrix([x, y, hole_depth / 2])
                 )
-                hole_mesh = trimesh.util.concatenate(hole_meshes)
-            else:
-                if segment_id is not None and segment_id > 15:
-                    self._print(f"  Note: segment_id {segment_id} exceeds 15; using center hole only")
-                hole_mesh = self._create_index_hole_for_sign(sign_length, sign_height, point_left)
-            new_mesh = sign_base.difference(hole_mesh)
-            if new_mesh is not None and len(new_mesh.faces) > 0:
-                sign_base = new_mesh
-            else:
-                self._print(f"  Warning: Index hole boolean returned empty mesh")
-        except Exception as e:
-            self._print(f"  Warning: Index hole boolean operation failed: {e}")
+                for x, y in hole_centers
+            ]
+            if self.debug:
+                self._check_cutters(hole_meshes, "index hole")
+            sign_base = self._difference_meshes(sign_base, hole_meshes)
         
         # Add embossed text using vector-based rendering
         if not FREETYPE_AVAILABLE:
@@ -1338,10 +1836,7 @@ class DirectionSignGenerator:
                 
                 # Create main text mesh
                 # Position: near square end (attachment point), vertically centered
-                if point_left:
-                    text_x = sign_length - attach_pad - main_text_width
-                else:
-                    text_x = attach_pad
+                text_x = place_x(attach_pad, main_text_width)
                 text_y = (sign_height / 2) - (font_size / 2.8)  # Adjusted for baseline offset
                 text_z = self.sign_thickness - self.boolean_overlap
                 
@@ -1350,10 +1845,7 @@ class DirectionSignGenerator:
                 # Create distance text meshes near the arrow end
                 distance_meshes = []
                 if distance_value:
-                    if point_left:
-                        distance_x = point_length + tip_padding
-                    else:
-                        distance_x = body_length - tip_padding - distance_width
+                    distance_x = place_x(body_length - tip_padding - distance_width, distance_width)
                     row_offset = distance_font_size * 0.8
                     top_center = (sign_height / 2) + (row_offset / 2)
                     bottom_center = (sign_height / 2) - (row_offset / 2)
@@ -1363,8 +1855,8 @@ class DirectionSignGenerator:
                         self._create_text_mesh_vector(distance_value, distance_font_size, (distance_x, dist_y, text_z))
                     )
                     if distance_units:
-                        value_width = len(distance_value) * distance_font_size * distance_width_factor
-                        units_width = len(distance_units) * units_font_size * distance_width_factor
+                        value_width = value_em * distance_font_size
+                        units_width = units_em * units_font_size
                         units_x = distance_x + (value_width - units_width) / 2
                         distance_meshes.append(
                             self._create_text_mesh_vector(distance_units, units_font_size, (units_x, units_y, text_z))
@@ -1375,16 +1867,24 @@ class DirectionSignGenerator:
                 self._print(f"  Text embossed: '{text}'")
                 
             except Exception as e:
-                import traceback
                 self._print(f"  Warning: Could not create vector text: {e}")
-                self._print(f"  Details: {traceback.format_exc()}")
+                if self.debug:
+                    self._print(f"  Details: {traceback.format_exc()}")
                 self._print(f"  Saving blank sign")
                 sign_mesh = sign_base
+                # Never cache a sign whose text failed
+                cache_path = None
         
         # Export
         self._log_components(sign_mesh, f"sign '{text}'")
-        sign_mesh.export(output_path)
+        self._export_stl(sign_mesh, output_path)
         self._print(f"  Saved: {output_path}")
+        if cache_path is not None:
+            # Copy then rename so parallel workers never see a partial cache file
+            os.makedirs(self.sign_cache_dir, exist_ok=True)
+            partial_path = f"{cache_path}.{os.getpid()}.tmp"
+            shutil.copyfile(output_path, partial_path)
+            os.replace(partial_path, cache_path)
     
     def generate_arrow(self, output_path: str):
         """
@@ -1396,3 +1896,35 @@ class DirectionSignGenerator:
         # TODO: Implement arrow generation
         self._print(f"Generating arrow pointer...")
         self._print(f"  Output: {output_path}")
+
+    def generate_signs(self, jobs: List[dict], max_workers: int | None = None):
+        """
+        Generate several sign plates, spreading them across worker processes.
+        
+        Args:
+            jobs: Keyword arguments for generate_sign, one dict per sign
+            max_workers: Worker process count (defaults to CPU count); 1 runs in-process
+        """
+        if max_workers is None:
+            max_workers = min(len(jobs), os.cpu_count() or 1)
+        if max_workers <= 1 or len(jobs) <= 1:
+            for job in jobs:
+                self.generate_sign(**job)
+            return
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_sign_worker,
+                                 initargs=(self,)) as pool:
+            list(pool.map(_generate_sign_worker, jobs))
+
+
+# Per-process generator used by generate_signs workers
+_worker_generator = None
+
+
+def _init_sign_worker(generator: DirectionSignGenerator) -> None:
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _generate_sign_worker(job: dict) -> str:
+    _worker_generator.generate_sign(**job)
+    return job["output_path"]